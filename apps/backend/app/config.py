@@ -15,3 +15,6 @@ API_PORT = int(os.getenv("PROP_AMM_API_PORT", "18002"))
 DASHBOARD_HOST = os.getenv("PROP_AMM_DASHBOARD_HOST", "127.0.0.1")
 DASHBOARD_PORT = int(os.getenv("PROP_AMM_DASHBOARD_PORT", "15173"))
 JOB_POLL_SECONDS = float(os.getenv("PROP_AMM_JOB_POLL_SECONDS", "1.0"))
+JOB_WORKERS = int(os.getenv("PROP_AMM_JOB_WORKERS", "2"))
+DB_POOL_MIN_SIZE = int(os.getenv("PROP_AMM_DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("PROP_AMM_DB_POOL_MAX_SIZE", str(os.cpu_count() or 4)))
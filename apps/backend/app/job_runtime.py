@@ -1,72 +1,272 @@
 from __future__ import annotations
 
-import json
+import codecs
+import io
+import logging
 import os
+import queue
 import re
 import sqlite3
 import subprocess
 import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from .config import DB_PATH, DATA_DIR, JOB_POLL_SECONDS, MAX_SOURCE_BYTES, ROOT_DIR
+import orjson
+
+from .config import (
+    DATA_DIR,
+    DB_PATH,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    JOB_POLL_SECONDS,
+    JOB_WORKERS,
+    MAX_SOURCE_BYTES,
+    ROOT_DIR,
+)
 
 CLI_CMD = ["cargo", "run", "--bin", "prop-amm-multi", "--"]
-STRATEGY_PATTERN = re.compile(r"^submission_[0-5]\.rs$")
+STRATEGY_EXISTS_TTL_SECONDS = 5.0
+DATA_VERSION_POLL_SECONDS = 0.01
 SAFE_FILE_PATTERN = re.compile(r"[^a-zA-Z0-9_.-]")
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_BUFFER_MAX_CHUNKS = 1024
+LOG_READ_BYTES = 64 * 1024
+LOG_PIPE_BUFFER_BYTES = 1024 * 1024
+LOG_FLUSH_SECONDS = 0.1
+STATEMENT_CACHE_SIZE = 256
+_ALLOWED_STRATEGIES = frozenset(f"submission_{i}.rs" for i in range(6))
+_STRATEGY_PATHS = {name: ROOT_DIR / name for name in _ALLOWED_STRATEGIES}
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=max(1, JOB_WORKERS), thread_name_prefix="prop-amm-job")
+_job_cv = threading.Condition()
+_running_lock = threading.Lock()
+_running_processes: set[subprocess.Popen] = set()
+_BASE_ENV = {**os.environ, "PATH": f"{Path.home() / '.cargo' / 'bin'}:{os.environ.get('PATH', '')}"}
+
+_SQL_INSERT_JOB = """
+INSERT INTO jobs (
+    status, job_type, strategy_files_json, simulations, steps, epoch_len, seed_start,
+    submitter_handle, created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_JOB = "SELECT * FROM jobs WHERE id = ?"
+_SQL_INSERT_STRATEGY_FILE = "INSERT INTO job_strategy_files (job_id, ord, path) VALUES (?, ?, ?)"
+_SQL_SELECT_STRATEGY_FILES = "SELECT path FROM job_strategy_files WHERE job_id = ? ORDER BY ord"
+_SQL_NEXT_LOG_SEQ = "SELECT COALESCE(MAX(seq) + 1, 0) AS next_seq FROM job_log_chunks WHERE job_id = ?"
+_SQL_APPEND_LOG = "INSERT INTO job_log_chunks (job_id, seq, chunk) VALUES (?, ?, ?)"
+_SQL_TOUCH_JOB = "UPDATE jobs SET updated_at = ? WHERE id = ?"
+_SQL_SET_STATE = "UPDATE jobs SET status = ?, exit_code = ?, error_message = ?, updated_at = ? WHERE id = ?"
+_SQL_CLAIM_RETURNING = (
+    "RETURNING id, status, job_type, strategy_files_json, simulations, steps, epoch_len, seed_start, submitter_handle"
+)
+_SQL_CLAIM_JOB = f"""
+UPDATE jobs SET status = 'running', updated_at = ?
+WHERE id = ? AND status = 'queued'
+{_SQL_CLAIM_RETURNING}
+"""
+_SQL_CLAIM_NEXT_JOB = f"""
+UPDATE jobs SET status = 'running', updated_at = ?
+WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY id ASC LIMIT 1)
+  AND status = 'queued'
+{_SQL_CLAIM_RETURNING}
+"""
+_SQL_INSERT_LEADERBOARD = """
+INSERT INTO leaderboard (
+    created_at, author, strategy_name, mean_edge, std_edge, edge_vs_normalizer, sharpe,
+    mean_final_capital_weight, attempts, receipt_path
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_LATEST_LEADERBOARD = """
+SELECT author, strategy_name, mean_edge, std_edge, edge_vs_normalizer, sharpe,
+       mean_final_capital_weight, attempts, receipt_path
+FROM leaderboard
+ORDER BY id DESC
+LIMIT ?
+"""
+_SQL_COUNT_STRATEGIES = "SELECT COUNT(DISTINCT strategy_name) AS strategies FROM leaderboard"
+_SQL_LATEST_COMPLETED_JOB = """
+SELECT simulations, steps, epoch_len
+FROM jobs
+WHERE status = 'completed' AND job_type IN ('run', 'submit')
+ORDER BY id DESC
+LIMIT 1
+"""
+_SQL_SELECT_LEGACY_LOGS = "SELECT logs FROM jobs WHERE id = ?"
+_SQL_SELECT_LOG_CHUNKS = "SELECT chunk FROM job_log_chunks WHERE job_id = ? ORDER BY seq"
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _conn() -> sqlite3.Connection:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(DB_PATH)
+class _ConnectionPool:
+    def __init__(self, factory: Callable[[], sqlite3.Connection], min_size: int, max_size: int) -> None:
+        self._factory = factory
+        self._max_size = max(1, max_size)
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=self._max_size)
+        self._created = 0
+        self._lock = threading.Lock()
+        for _ in range(min(max(0, min_size), self._max_size)):
+            self._idle.put(self._new_connection())
+
+    def _new_connection(self) -> sqlite3.Connection:
+        connection = self._factory()
+        self._created += 1
+        return connection
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._max_size:
+                return self._new_connection()
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._idle.put(conn)
+
+
+def _connect(readonly: bool = False) -> sqlite3.Connection:
+    if readonly:
+        connection = sqlite3.connect(
+            f"{DB_PATH.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.execute("PRAGMA query_only = 1")
+    else:
+        connection = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        # WAL is persistent in the database file, so only the writer needs to switch it on.
+        connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA busy_timeout = 5000")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute("PRAGMA cache_size = -20000")
+    connection.execute("PRAGMA foreign_keys = ON")
     connection.row_factory = sqlite3.Row
     return connection
 
 
-def init_db() -> None:
+_pools_lock = threading.Lock()
+_write_pool: _ConnectionPool | None = None
+_read_pool: _ConnectionPool | None = None
+
+
+def _pools() -> tuple[_ConnectionPool, _ConnectionPool]:
+    global _write_pool, _read_pool
+    if _write_pool is None or _read_pool is None:
+        with _pools_lock:
+            if _write_pool is None or _read_pool is None:
+                DATA_DIR.mkdir(parents=True, exist_ok=True)
+                DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+                write_pool = _ConnectionPool(_connect, 1, 1)
+                with write_pool.connection() as conn:
+                    _create_schema(conn)
+                # Read-only connections need the database file to exist, so they are opened after the schema.
+                _read_pool = _ConnectionPool(lambda: _connect(readonly=True), DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE)
+                _write_pool = write_pool
+    return _write_pool, _read_pool
+
+
+@contextmanager
+def _conn(readonly: bool = False) -> Iterator[sqlite3.Connection]:
+    write_pool, read_pool = _pools()
+    pool = read_pool if readonly else write_pool
+    with pool.connection() as conn:
+        yield conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
     with _conn() as conn:
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                status TEXT NOT NULL,
-                job_type TEXT NOT NULL,
-                strategy_files_json TEXT NOT NULL,
-                simulations INTEGER NOT NULL,
-                steps INTEGER NOT NULL,
-                epoch_len INTEGER NOT NULL,
-                seed_start INTEGER NOT NULL,
-                submitter_handle TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                exit_code INTEGER,
-                error_message TEXT,
-                logs TEXT DEFAULT ''
-            );
-
-            CREATE TABLE IF NOT EXISTS leaderboard (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                created_at TEXT NOT NULL,
-                author TEXT,
-                strategy_name TEXT NOT NULL,
-                mean_edge REAL NOT NULL,
-                std_edge REAL NOT NULL,
-                edge_vs_normalizer REAL NOT NULL,
-                sharpe REAL NOT NULL,
-                mean_final_capital_weight REAL NOT NULL,
-                attempts INTEGER NOT NULL DEFAULT 1,
-                receipt_path TEXT
-            );
-            """
-        )
-        _ensure_column(conn, "jobs", "submitter_handle", "TEXT")
-        _ensure_column(conn, "leaderboard", "author", "TEXT")
-        _ensure_column(conn, "leaderboard", "attempts", "INTEGER NOT NULL DEFAULT 1")
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+
+
+def init_db() -> None:
+    _pools()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            status TEXT NOT NULL,
+            job_type TEXT NOT NULL,
+            strategy_files_json TEXT NOT NULL,
+            simulations INTEGER NOT NULL,
+            steps INTEGER NOT NULL,
+            epoch_len INTEGER NOT NULL,
+            seed_start INTEGER NOT NULL,
+            submitter_handle TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            exit_code INTEGER,
+            error_message TEXT,
+            logs TEXT DEFAULT ''
+        );
+
+        CREATE TABLE IF NOT EXISTS leaderboard (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            author TEXT,
+            strategy_name TEXT NOT NULL,
+            mean_edge REAL NOT NULL,
+            std_edge REAL NOT NULL,
+            edge_vs_normalizer REAL NOT NULL,
+            sharpe REAL NOT NULL,
+            mean_final_capital_weight REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            receipt_path TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS job_strategy_files (
+            job_id INTEGER NOT NULL REFERENCES jobs(id),
+            ord INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            PRIMARY KEY (job_id, ord)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS job_log_chunks (
+            job_id INTEGER NOT NULL REFERENCES jobs(id),
+            seq INTEGER NOT NULL,
+            chunk TEXT NOT NULL,
+            PRIMARY KEY (job_id, seq)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS idx_jobs_queued ON jobs(id) WHERE status = 'queued';
+        CREATE INDEX IF NOT EXISTS idx_jobs_done ON jobs(id DESC)
+            WHERE status = 'completed' AND job_type IN ('run', 'submit');
+        CREATE INDEX IF NOT EXISTS idx_lb_strategy ON leaderboard(strategy_name);
+        """
+    )
+    _ensure_column(conn, "jobs", "submitter_handle", "TEXT")
+    _ensure_column(conn, "leaderboard", "author", "TEXT")
+    _ensure_column(conn, "leaderboard", "attempts", "INTEGER NOT NULL DEFAULT 1")
 
 
 def _ensure_column(conn: sqlite3.Connection, table: str, column: str, definition: str) -> None:
@@ -77,13 +277,18 @@ def _ensure_column(conn: sqlite3.Connection, table: str, column: str, definition
     conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
 
 
+@lru_cache(maxsize=4 * len(_ALLOWED_STRATEGIES))
+def _strategy_exists(name: str, ttl_bucket: int) -> bool:
+    return _STRATEGY_PATHS[name].exists()
+
+
 def validate_strategy_files(files: list[str]) -> list[str]:
+    ttl_bucket = int(time.monotonic() // STRATEGY_EXISTS_TTL_SECONDS)
     validated = []
     for name in files:
-        if not STRATEGY_PATTERN.match(name):
+        if name not in _ALLOWED_STRATEGIES:
             raise ValueError(f"Unsupported strategy filename: {name}")
-        full_path = ROOT_DIR / name
-        if not full_path.exists():
+        if not _strategy_exists(name, ttl_bucket):
             raise ValueError(f"Strategy file not found: {name}")
         validated.append(name)
     return validated
@@ -123,18 +328,13 @@ def create_job(
     seed_start: int,
 ) -> int:
     now = utc_now_iso()
-    with _conn() as conn:
+    with _transaction() as conn:
         cur = conn.execute(
-            """
-            INSERT INTO jobs (
-                status, job_type, strategy_files_json, simulations, steps, epoch_len, seed_start,
-                submitter_handle, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_JOB,
             (
                 "queued",
                 job_type,
-                json.dumps(strategy_files),
+                "[]",
                 simulations,
                 steps,
                 epoch_len,
@@ -144,35 +344,117 @@ def create_job(
                 now,
             ),
         )
-        return int(cur.lastrowid)
+        job_id = int(cur.lastrowid)
+        conn.executemany(
+            _SQL_INSERT_STRATEGY_FILE,
+            [(job_id, ord_, path) for ord_, path in enumerate(strategy_files)],
+        )
+    with _job_cv:
+        _job_cv.notify_all()
+    return job_id
 
 
-def get_job(job_id: int) -> dict | None:
-    with _conn() as conn:
-        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-    if row is None:
-        return None
+def _job_payload(conn: sqlite3.Connection, row: sqlite3.Row) -> dict:
     payload = dict(row)
-    payload["strategy_files"] = json.loads(payload.pop("strategy_files_json"))
+    legacy_files = payload.pop("strategy_files_json")
+    files = conn.execute(_SQL_SELECT_STRATEGY_FILES, (payload["id"],)).fetchall()
+    # Jobs created before job_strategy_files existed only have the JSON column.
+    payload["strategy_files"] = [f["path"] for f in files] if files else orjson.loads(legacy_files)
     return payload
 
 
+def get_job(job_id: int) -> dict | None:
+    with _conn(readonly=True) as conn:
+        row = conn.execute(_SQL_SELECT_JOB, (job_id,)).fetchone()
+        if row is None:
+            return None
+        return _job_payload(conn, row)
+
+
+_log_seq_lock = threading.Lock()
+_log_seq: dict[int, int] = {}
+
+
 def append_logs(job_id: int, chunk: str) -> None:
     now = utc_now_iso()
-    with _conn() as conn:
-        conn.execute(
-            "UPDATE jobs SET logs = logs || ?, updated_at = ? WHERE id = ?",
-            (chunk, now, job_id),
-        )
+    with _log_seq_lock, _transaction() as conn:
+        seq = _log_seq.get(job_id)
+        if seq is None:
+            row = conn.execute(_SQL_NEXT_LOG_SEQ, (job_id,)).fetchone()
+            seq = int(row["next_seq"])
+        conn.execute(_SQL_APPEND_LOG, (job_id, seq, chunk))
+        conn.execute(_SQL_TOUCH_JOB, (now, job_id))
+        _log_seq[job_id] = seq + 1
 
 
 def _set_job_state(job_id: int, status: str, exit_code: int | None = None, error_message: str | None = None) -> None:
     now = utc_now_iso()
-    with _conn() as conn:
-        conn.execute(
-            "UPDATE jobs SET status = ?, exit_code = ?, error_message = ?, updated_at = ? WHERE id = ?",
-            (status, exit_code, error_message, now, job_id),
-        )
+    with _transaction() as conn:
+        conn.execute(_SQL_SET_STATE, (status, exit_code, error_message, now, job_id))
+    with _log_seq_lock:
+        _log_seq.pop(job_id, None)
+
+
+class _LogBuffer:
+    def __init__(self, job_id: int, max_bytes: int = LOG_FLUSH_BYTES, interval: float = LOG_FLUSH_SECONDS) -> None:
+        self._job_id = job_id
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._chunks: deque[bytes] = deque(maxlen=LOG_BUFFER_MAX_CHUNKS)
+        self._size = 0
+        # Output whose write failed; only touched under _flush_lock and retried first on the next flush.
+        self._pending = b""
+        # Incremental so a UTF-8 sequence split across two flushes still decodes cleanly.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def append(self, chunk: bytes) -> None:
+        if len(self._chunks) == self._chunks.maxlen:
+            # A full deque would silently drop the oldest output, so drain it here instead.
+            self.flush()
+        with self._lock:
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            full = self._size >= self._max_bytes
+        if full:
+            self._wakeup.set()
+
+    def flush(self, final: bool = False) -> None:
+        with self._flush_lock:
+            with self._lock:
+                data = self._pending + b"".join(self._chunks)
+                self._chunks.clear()
+                self._size = 0
+            decoder_state = self._decoder.getstate()
+            text = self._decoder.decode(data, final=final)
+            if text:
+                try:
+                    append_logs(self._job_id, text)
+                except Exception:
+                    self._decoder.setstate(decoder_state)
+                    self._pending = data
+                    raise
+            self._pending = b""
+
+    def close(self) -> None:
+        self._closed.set()
+        self._wakeup.set()
+        self._thread.join()
+        self.flush(final=True)
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush logs for job %s; retrying", self._job_id)
 
 
 def _build_command(job: dict) -> list[str]:
@@ -194,77 +476,89 @@ def _build_command(job: dict) -> list[str]:
 
 
 def parse_and_store_leaderboard(log_text: str, author: str | None = None) -> None:
+    now = utc_now_iso()
     rows = []
+    receipt = None
     for line in log_text.splitlines():
-        line = line.strip()
-        if "submission_" not in line:
+        if "Submission receipt:" in line:
+            receipt = line.split("Submission receipt:", 1)[1].strip()
             continue
-        parts = line.split()
+        line = line.lstrip()
+        if not line.startswith("submission_"):
+            continue
+        parts = line.split(None, 6)
         if len(parts) < 6:
             continue
         name = parts[0]
-        if not name.startswith("submission_"):
-            continue
         try:
-            mean_edge = float(parts[1])
-            std_edge = float(parts[2])
-            edge_vs_normalizer = float(parts[3])
-            sharpe = float(parts[4])
-            final_cap_pct = float(parts[5])
+            mean_edge, std_edge, edge_vs_normalizer, sharpe, final_cap_pct = map(float, parts[1:6])
         except ValueError:
             continue
-        rows.append((name, mean_edge, std_edge, edge_vs_normalizer, sharpe, final_cap_pct / 100.0))
-
-    receipt = None
-    for line in log_text.splitlines():
-        if "Submission receipt:" in line:
-            receipt = line.split("Submission receipt:", 1)[1].strip()
+        rows.append(
+            (now, author, name, mean_edge, std_edge, edge_vs_normalizer, sharpe, final_cap_pct / 100.0, 1, None)
+        )
 
     if not rows:
         return
 
-    now = utc_now_iso()
-    with _conn() as conn:
-        conn.executemany(
-            """
-            INSERT INTO leaderboard (
-                created_at, author, strategy_name, mean_edge, std_edge, edge_vs_normalizer, sharpe,
-                mean_final_capital_weight, attempts, receipt_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [(now, author, r[0], r[1], r[2], r[3], r[4], r[5], 1, receipt) for r in rows],
-        )
+    if receipt is not None:
+        rows = [row[:-1] + (receipt,) for row in rows]
+
+    with _transaction() as conn:
+        conn.executemany(_SQL_INSERT_LEADERBOARD, rows)
 
 
-def process_job(job_id: int, already_claimed: bool = False) -> None:
-    job = get_job(job_id) if already_claimed else claim_job(job_id)
+def process_job(job_id: int) -> None:
+    job = claim_job(job_id)
     if job is None:
         return
+    _run_claimed_job(job)
+
+
+def _run_claimed_job(job: dict) -> None:
+    try:
+        _run_job(job)
+    except Exception:
+        _set_job_state(int(job["id"]), "failed", error_message="job execution failed")
+        raise
 
-    cmd = _build_command(job)
 
-    env = os.environ.copy()
-    cargo_bin = Path.home() / ".cargo" / "bin"
-    env["PATH"] = f"{cargo_bin}:{env.get('PATH', '')}"
+def _run_job(job: dict) -> None:
+    job_id = int(job["id"])
+    cmd = _build_command(job)
 
     process = subprocess.Popen(
         cmd,
         cwd=ROOT_DIR,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        env=env,
+        bufsize=LOG_PIPE_BUFFER_BYTES,
+        env=_BASE_ENV,
     )
+    with _running_lock:
+        _running_processes.add(process)
 
     assert process.stdout is not None
-    full_log = []
-    for line in process.stdout:
-        full_log.append(line)
-        append_logs(job_id, line)
-
-    process.wait()
-    log_text = "".join(full_log)
+    full_log = io.BytesIO()
+    try:
+        buffer = _LogBuffer(job_id)
+        try:
+            # read1 returns whatever the pipe has ready, so slow output still streams to the log.
+            for chunk in iter(lambda: process.stdout.read1(LOG_READ_BYTES), b""):
+                full_log.write(chunk)
+                buffer.append(chunk)
+        finally:
+            buffer.close()
+        process.wait()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        with _running_lock:
+            _running_processes.discard(process)
+
+    log_text = full_log.getvalue().decode("utf-8", errors="replace")
 
     if process.returncode == 0:
         _set_job_state(job_id, "completed", exit_code=0)
@@ -274,84 +568,54 @@ def process_job(job_id: int, already_claimed: bool = False) -> None:
         _set_job_state(job_id, "failed", exit_code=process.returncode, error_message="job execution failed")
 
 
+def _log_job_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Inline job failed", exc_info=exc)
+
+
 def spawn_job(job_id: int) -> None:
-    thread = threading.Thread(target=process_job, args=(job_id,), daemon=True)
-    thread.start()
+    _executor.submit(process_job, job_id).add_done_callback(_log_job_failure)
+
+
+def shutdown_jobs() -> None:
+    # Executor threads are joined at interpreter exit, so stop the cargo processes they are waiting on.
+    _executor.shutdown(wait=False, cancel_futures=True)
+    with _running_lock:
+        for process in _running_processes:
+            process.terminate()
 
 
 def claim_job(job_id: int) -> dict | None:
     now = utc_now_iso()
     with _conn() as conn:
-        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-        if row is None or row["status"] != "queued":
+        rows = conn.execute(_SQL_CLAIM_JOB, (now, job_id)).fetchall()
+        if not rows:
             return None
-        conn.execute(
-            "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ? AND status = 'queued'",
-            (now, job_id),
-        )
-        row2 = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-
-    if row2 is None or row2["status"] != "running":
-        return None
+        return _job_payload(conn, rows[0])
 
-    payload = dict(row2)
-    payload["strategy_files"] = json.loads(payload.pop("strategy_files_json"))
-    return payload
 
-
-def claim_next_queued_job() -> int | None:
+def claim_next_queued_job() -> dict | None:
     now = utc_now_iso()
     with _conn() as conn:
-        row = conn.execute(
-            "SELECT id FROM jobs WHERE status = 'queued' ORDER BY id ASC LIMIT 1"
-        ).fetchone()
-        if row is None:
+        rows = conn.execute(_SQL_CLAIM_NEXT_JOB, (now,)).fetchall()
+        if not rows:
             return None
-        job_id = int(row["id"])
-        conn.execute(
-            "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ? AND status = 'queued'",
-            (now, job_id),
-        )
-        check = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
-
-    if check is None or check["status"] != "running":
-        return None
-    return job_id
+        return _job_payload(conn, rows[0])
 
 
 def latest_leaderboard(limit: int = 20) -> list[dict]:
-    with _conn() as conn:
-        rows = conn.execute(
-            """
-            SELECT author, strategy_name, mean_edge, std_edge, edge_vs_normalizer, sharpe,
-                   mean_final_capital_weight, attempts, receipt_path
-            FROM leaderboard
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
+    with _conn(readonly=True) as conn:
+        rows = conn.execute(_SQL_LATEST_LEADERBOARD, (limit,)).fetchall()
     return [dict(r) for r in rows]
 
 
 def dashboard_stats() -> dict:
-    with _conn() as conn:
-        row = conn.execute(
-            """
-            SELECT COUNT(DISTINCT strategy_name) AS strategies
-            FROM leaderboard
-            """
-        ).fetchone()
-
-        latest_job = conn.execute(
-            """
-            SELECT simulations, steps, epoch_len
-            FROM jobs
-            WHERE status = 'completed' AND job_type IN ('run', 'submit')
-            ORDER BY id DESC
-            LIMIT 1
-            """
-        ).fetchone()
+    with _conn(readonly=True) as conn:
+        row = conn.execute(_SQL_COUNT_STRATEGIES).fetchone()
+        latest_job = conn.execute(_SQL_LATEST_COMPLETED_JOB).fetchone()
 
     return {
         "strategies": int(row["strategies"]) if row and row["strategies"] is not None else 0,
@@ -363,18 +627,41 @@ def dashboard_stats() -> dict:
 
 
 def get_logs(job_id: int) -> str | None:
-    with _conn() as conn:
-        row = conn.execute("SELECT logs FROM jobs WHERE id = ?", (job_id,)).fetchone()
-    if row is None:
-        return None
-    return str(row["logs"])
+    with _conn(readonly=True) as conn:
+        row = conn.execute(_SQL_SELECT_LEGACY_LOGS, (job_id,)).fetchone()
+        if row is None:
+            return None
+        chunks = conn.execute(_SQL_SELECT_LOG_CHUNKS, (job_id,)).fetchall()
+    # jobs.logs only holds output written before logs moved to job_log_chunks.
+    return str(row["logs"] or "") + "".join(chunk["chunk"] for chunk in chunks)
+
+
+def _data_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA data_version").fetchone()[0])
+
+
+def _wait_for_queue_change(monitor: sqlite3.Connection, version: int, timeout: float) -> None:
+    # data_version only moves when another connection commits, so polling it is far cheaper than re-claiming.
+    deadline = time.monotonic() + timeout
+    while _data_version(monitor) == version:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        with _job_cv:
+            if _job_cv.wait(timeout=min(DATA_VERSION_POLL_SECONDS, remaining)):
+                return
 
 
 def run_worker_loop(poll_seconds: float = JOB_POLL_SECONDS) -> None:
     init_db()
+    monitor = _connect(readonly=True)
     while True:
+        version = _data_version(monitor)
         next_job = claim_next_queued_job()
         if next_job is None:
-            time.sleep(poll_seconds)
+            _wait_for_queue_change(monitor, version, poll_seconds)
             continue
-        process_job(next_job, already_claimed=True)
+        try:
+            _run_claimed_job(next_job)
+        except Exception:
+            logger.exception("Job %s failed", next_job["id"])
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from pydantic import TypeAdapter
 
 from .config import CORS_ORIGINS, DASHBOARD_HOST, DASHBOARD_PORT, INLINE_JOB_EXECUTION
 
@@ -12,11 +13,14 @@ from .job_runtime import (
     init_db,
     latest_leaderboard,
     normalize_strategy_inputs,
+    shutdown_jobs,
     spawn_job,
 )
 from .models import DashboardStats, JobCreateRequest, JobCreateResponse, JobStatusResponse, LeaderboardEntry
 
-app = FastAPI(title="Prop AMM Submit API", version="0.1.0")
+_LEADERBOARD_ADAPTER = TypeAdapter(list[LeaderboardEntry])
+
+app = FastAPI(title="Prop AMM Submit API", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +36,11 @@ def startup() -> None:
     init_db()
 
 
+@app.on_event("shutdown")
+def shutdown() -> None:
+    shutdown_jobs()
+
+
 @app.get("/")
 def root() -> dict:
     return {
@@ -85,7 +94,7 @@ def get_job_endpoint(job_id: int) -> JobStatusResponse:
     job = get_job(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="job not found")
-    return JobStatusResponse(**job)
+    return JobStatusResponse.model_validate(job)
 
 
 @app.get("/api/jobs/{job_id}/logs", response_class=PlainTextResponse)
@@ -99,9 +108,9 @@ def get_job_logs_endpoint(job_id: int) -> str:
 @app.get("/api/leaderboard", response_model=list[LeaderboardEntry])
 def leaderboard_endpoint() -> list[LeaderboardEntry]:
     rows = latest_leaderboard(limit=50)
-    return [LeaderboardEntry(**row) for row in rows]
+    return _LEADERBOARD_ADAPTER.validate_python(rows)
 
 
 @app.get("/api/stats", response_model=DashboardStats)
 def stats_endpoint() -> DashboardStats:
-    return DashboardStats(**dashboard_stats())
+    return DashboardStats.model_validate(dashboard_stats())